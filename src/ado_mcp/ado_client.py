@@ -1,29 +1,346 @@
 """Azure DevOps API client wrapper."""
 
+import asyncio
+import functools
+import importlib.util
 import os
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Dict, List, Any, Optional, Tuple, Union
+from urllib.parse import quote
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from dotenv import load_dotenv
 from azure.devops.connection import Connection
 from azure.devops.v7_1.work_item_tracking import WorkItemTrackingClient
 from azure.devops.v7_1.work_item_tracking.models import JsonPatchOperation
 from msrest.authentication import BasicAuthentication
 
+try:
+    # orjson parses straight from bytes and is several times faster than json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
-class ADOClient:
+# HTTP/2 support in httpx needs the optional h2 package
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Maximum number of IDs accepted by a single workitemsbatch request
+MAX_BATCH_SIZE = 200
+
+# Batch requests in flight at once, kept low to stay within ADO rate limits
+_BATCH_CONCURRENCY = 4
+
+# Fields needed to build the work item dictionary returned by ADOClient
+_WORK_ITEM_FIELDS = [
+    "System.Title",
+    "System.WorkItemType",
+    "System.State",
+    "System.Description",
+    "System.AssignedTo",
+    "System.CreatedDate",
+    "System.ChangedDate",
+    "System.CreatedBy",
+    "System.AreaPath",
+    "System.IterationPath",
+    "System.Tags",
+    "Microsoft.VSTS.TCM.ReproSteps",
+]
+
+# Fields needed for one-line work item summaries (no HTML bodies)
+SUMMARY_FIELDS = [
+    "System.Title",
+    "System.WorkItemType",
+    "System.State",
+    "System.AssignedTo",
+]
+
+# Result keys copied straight from work item fields, defaulting to ""
+_SCALAR_FIELDS = (
+    ("title", "System.Title"),
+    ("type", "System.WorkItemType"),
+    ("state", "System.State"),
+    ("description", "System.Description"),
+    ("created_date", "System.CreatedDate"),
+    ("changed_date", "System.ChangedDate"),
+    ("area_path", "System.AreaPath"),
+    ("iteration_path", "System.IterationPath"),
+    ("tags", "System.Tags"),
+)
+
+
+def _identity_name(value: Any, default: str) -> str:
+    """Get the display name of an identity field, which may be a dict or a plain string."""
+    # type() is avoids isinstance's subclass check; the REST payload only holds plain dicts
+    if type(value) is dict:
+        return value.get("displayName", default)
+    return value or default
+
+
+# Seconds to wait on direct REST calls, matching the SDK's (msrest) default
+_REQUEST_TIMEOUT = 100
+
+# Retry throttled and transient server failures on the open connection,
+# backing off and honoring Retry-After
+_RETRY_POLICY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST", "PATCH"]),
+    respect_retry_after_header=True,
+)
+
+
+# Recently fetched work items are reused for this long before being revalidated
+_CACHE_TTL_SECONDS = 30
+_CACHE_MAXSIZE = 512
+
+
+class _TTLCache:
+    """Thread-safe LRU cache whose entries go stale after a fixed time-to-live."""
+
+    __slots__ = ("_maxsize", "_ttl", "_data", "_lock")
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Tuple[Any, bool]:
+        """Return (value, fresh), or (None, False) if the key is not cached."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None, False
+            self._data.move_to_end(key)
+            expires_at, value = entry
+            return value, time.monotonic() < expires_at
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value, restarting its time-to-live."""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            if len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        """Drop a cached value if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+
+@dataclass(frozen=True, slots=True)
+class Comment:
+    """A comment on a work item."""
+
+    text: str
+    created_by: str
+    created_date: str
+
+
+@dataclass(frozen=True, slots=True)
+class ADOConfig:
+    """Azure DevOps connection settings."""
+
+    organization: str
+    project: str
+    pat: str = field(repr=False)
+    # Fetch work items with direct REST calls instead of the SDK models
+    use_raw_rest: bool = False
+    # Serve tool calls with the httpx-based ADOAsyncClient instead of ADOClient
+    use_async_client: bool = False
+
+
+@functools.lru_cache(maxsize=1)
+def get_config() -> ADOConfig:
+    """
+    Load the ADO configuration from the environment (and .env file) once.
+
+    Raises:
+        ValueError: If any of ADO_ORGANIZATION, ADO_PROJECT or ADO_PAT is missing
+    """
+    # Load environment variables from .env file
+    load_dotenv()
+
+    organization = os.getenv("ADO_ORGANIZATION")
+    project = os.getenv("ADO_PROJECT")
+    pat = os.getenv("ADO_PAT")
+
+    if not all([organization, project, pat]):
+        raise ValueError(
+            "Missing required environment variables: ADO_ORGANIZATION, ADO_PROJECT, ADO_PAT"
+        )
+
+    return ADOConfig(
+        organization=organization,
+        project=project,
+        pat=pat,
+        use_raw_rest=os.getenv("USE_RAW_REST") == "1",
+        use_async_client=os.getenv("USE_ASYNC_CLIENT") == "1",
+    )
+
+
+def _format_work_item(work_item_id: int, fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the commonly used work item fields into a dictionary."""
+    # Extract common fields
+    result = {key: fields.get(field_name, "") for key, field_name in _SCALAR_FIELDS}
+    result["id"] = work_item_id
+    result["assigned_to"] = _identity_name(fields.get("System.AssignedTo"), "Unassigned")
+    result["created_by"] = _identity_name(fields.get("System.CreatedBy"), "Unknown")
+
+    # Add steps to reproduce if it exists (common in bugs)
+    if "Microsoft.VSTS.TCM.ReproSteps" in fields:
+        result["steps_to_reproduce"] = fields["Microsoft.VSTS.TCM.ReproSteps"]
+
+    return result
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying a response, preferring its Retry-After header."""
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            pass
+    return _RETRY_POLICY.backoff_factor * (2**attempt)
+
+
+def _comment_from_json(comment: Dict[str, Any]) -> Comment:
+    """Build a Comment from a comments REST API entry."""
+    return Comment(
+        text=comment.get("text", ""),
+        created_by=_identity_name(comment.get("createdBy"), "Unknown"),
+        created_date=comment.get("createdDate", ""),
+    )
+
+
+def _comments_from_response(response: Union[requests.Response, httpx.Response]) -> List[Comment]:
+    """Parse a comments API response, raising for any error other than 404."""
+    # Some work items might not have comments enabled
+    if response.status_code == 404:
+        return []
+    response.raise_for_status()
+
+    return [
+        _comment_from_json(comment)
+        for comment in _json_loads(response.content).get("comments", [])
+    ]
+
+
+def _with_comments(result: Dict[str, Any], comments: List[Comment]) -> Dict[str, Any]:
+    """Attach comments and their count to a work item dictionary."""
+    result["comments"] = comments
+    result["comment_count"] = len(comments)
+    return result
+
+
+def _chunks(ids: List[int]) -> List[List[int]]:
+    """Split IDs into slices the workitemsbatch endpoint accepts."""
+    return [ids[start : start + MAX_BATCH_SIZE] for start in range(0, len(ids), MAX_BATCH_SIZE)]
+
+
+def _batch_request_body(ids: List[int], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Build a workitemsbatch request body."""
+    # Omit missing or inaccessible IDs instead of failing the whole batch
+    return {"ids": ids, "fields": fields or _WORK_ITEM_FIELDS, "errorPolicy": "Omit"}
+
+
+def _work_items_from_batch(
+    response: Union[requests.Response, httpx.Response]
+) -> List[Dict[str, Any]]:
+    """Parse a workitemsbatch response, skipping the null entries of omitted IDs."""
+    response.raise_for_status()
+
+    return [
+        _format_work_item(item["id"], item.get("fields", {}))
+        for item in _json_loads(response.content).get("value", [])
+        if item is not None
+    ]
+
+
+class _BatchMixin:
+    """
+    Concurrent, rate-limited workitemsbatch fan-out shared by both clients.
+
+    Subclasses provide _fetch_chunk and a _batch_semaphore slot set to None.
+    """
+
+    __slots__ = ()
+
+    async def aget_work_items_batch(
+        self, ids: List[int], fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get any number of work items, split into concurrent workitemsbatch requests.
+
+        IDs are chunked into MAX_BATCH_SIZE slices, with at most
+        _BATCH_CONCURRENCY requests in flight at a time across all calls on this client.
+
+        Args:
+            ids: IDs of the work items to retrieve
+            fields: Field reference names to return (defaults to the fields used in results)
+
+        Returns:
+            List of work item dictionaries in the order the server returned each chunk
+        """
+        results = await asyncio.gather(
+            *(self._fetch_chunk_limited(chunk, fields) for chunk in _chunks(ids))
+        )
+        return [work_item for chunk_result in results for work_item in chunk_result]
+
+    async def _fetch_chunk_limited(
+        self, ids: List[int], fields: Optional[List[str]]
+    ) -> List[Dict[str, Any]]:
+        """Run one chunk request once a client-wide slot is free."""
+        # Created lazily so the semaphore belongs to the running event loop
+        if self._batch_semaphore is None:
+            self._batch_semaphore = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+        async with self._batch_semaphore:
+            return await self._fetch_chunk(ids, fields)
+
+
+class ADOClient(_BatchMixin):
     """Client for interacting with Azure DevOps API."""
 
-    def __init__(self):
-        """Initialize the ADO client with credentials from environment variables."""
-        self.organization = os.getenv("ADO_ORGANIZATION")
-        self.project = os.getenv("ADO_PROJECT")
-        pat = os.getenv("ADO_PAT")
+    __slots__ = (
+        "organization",
+        "project",
+        "connection",
+        "wit_client",
+        "_use_raw_rest",
+        "_wit_api_url",
+        "_session",
+        "_cache",
+        "_batch_semaphore",
+    )
 
-        if not all([self.organization, self.project, pat]):
-            raise ValueError(
-                "Missing required environment variables: ADO_ORGANIZATION, ADO_PROJECT, ADO_PAT"
-            )
+    def __init__(self, config: Optional[ADOConfig] = None):
+        """
+        Initialize the ADO client.
+
+        Args:
+            config: Connection settings; defaults to the cached environment config
+        """
+        if config is None:
+            config = get_config()
+
+        self.organization = config.organization
+        self.project = config.project
+        self._use_raw_rest = config.use_raw_rest
+        pat = config.pat
 
         # Build organization URL
         organization_url = f"https://dev.azure.com/{self.organization}"
+        self._wit_api_url = f"{organization_url}/{quote(self.project)}/_apis/wit"
 
         # Create connection
         credentials = BasicAuthentication("", pat)
@@ -32,6 +349,57 @@ class ADOClient:
         # Get work item tracking client
         self.wit_client: WorkItemTrackingClient = self.connection.clients.get_work_item_tracking_client()
 
+        # Share one pooled session so repeated calls reuse the TCP/TLS connection
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=_RETRY_POLICY)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.auth = ("", pat)
+        self._attach_session(self.wit_client)
+
+        # Recently fetched work items, keyed by ID
+        self._cache = _TTLCache(_CACHE_MAXSIZE, _CACHE_TTL_SECONDS)
+
+        # Caps batch requests in flight across all calls; created on first use
+        self._batch_semaphore: Optional[asyncio.Semaphore] = None
+
+        self._warm_up()
+
+    def _attach_session(self, client) -> None:
+        """Route an SDK client's requests through the shared pooled session."""
+        # msrest closes its session after every call unless keep_alive is set
+        client.config.keep_alive = True
+        driver = client.config.pipeline._sender.driver
+        # The driver keeps one session per thread; pin ours for every thread instead
+        driver._init_session(self._session)
+        driver._session_mapping = SimpleNamespace(session=self._session)
+        # _init_session installs msrest's own retry policy; restore ours
+        for adapter in self._session.adapters.values():
+            adapter.max_retries = _RETRY_POLICY
+
+    def _warm_up(self) -> None:
+        """
+        Open the pooled connection before the first tool call needs it.
+
+        A small work item tracking request pays the TLS handshake and loads the
+        SDK's resource location cache up front. Failures are ignored; the real
+        request will report them.
+        """
+        try:
+            self.wit_client.get_work_item_type_categories(project=self.project)
+        except Exception:
+            pass
+
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self._session.close()
+
+    def __enter__(self) -> "ADOClient":
+        return self
+
+    def __exit__(self, *exc_details) -> None:
+        self.close()
+
     def get_work_item(self, work_item_id: int) -> Dict[str, Any]:
         """
         Get detailed information about a work item.
@@ -50,90 +418,182 @@ class ADOClient:
             - created_date: When the work item was created
             - changed_date: When the work item was last modified
             - steps_to_reproduce: Steps to reproduce (if applicable for bugs)
-            - comments: List of comments on the work item
+            - comments: List of Comment objects on the work item
         """
         try:
-            # Get the work item with all fields
-            work_item = self.wit_client.get_work_item(
-                id=work_item_id,
-                project=self.project,
-                expand="All"
+            cached, fresh = self._cache.get(work_item_id)
+            if cached is not None and (fresh or self._is_unchanged(cached)):
+                return cached
+
+            result = _with_comments(
+                _format_work_item(*self._fetch_work_item_fields(work_item_id)),
+                self.get_work_item_comments(work_item_id),
             )
 
-            fields = work_item.fields
-
-            # Extract common fields
-            result = {
-                "id": work_item.id,
-                "title": fields.get("System.Title", ""),
-                "type": fields.get("System.WorkItemType", ""),
-                "state": fields.get("System.State", ""),
-                "description": fields.get("System.Description", ""),
-                "assigned_to": fields.get("System.AssignedTo", {}).get("displayName", "Unassigned")
-                if isinstance(fields.get("System.AssignedTo"), dict)
-                else str(fields.get("System.AssignedTo", "Unassigned")),
-                "created_date": str(fields.get("System.CreatedDate", "")),
-                "changed_date": str(fields.get("System.ChangedDate", "")),
-                "created_by": fields.get("System.CreatedBy", {}).get("displayName", "Unknown")
-                if isinstance(fields.get("System.CreatedBy"), dict)
-                else str(fields.get("System.CreatedBy", "Unknown")),
-                "area_path": fields.get("System.AreaPath", ""),
-                "iteration_path": fields.get("System.IterationPath", ""),
-                "tags": fields.get("System.Tags", ""),
-            }
-
-            # Add steps to reproduce if it exists (common in bugs)
-            if "Microsoft.VSTS.TCM.ReproSteps" in fields:
-                result["steps_to_reproduce"] = fields["Microsoft.VSTS.TCM.ReproSteps"]
-
-            # Get comments
-            comments = self.get_work_item_comments(work_item_id)
-            result["comments"] = comments
-            result["comment_count"] = len(comments)
+            self._cache.set(work_item_id, result)
+            return result
+
+        except Exception as e:
+            raise Exception(f"Failed to get work item {work_item_id}: {str(e)}")
+
+    async def aget_work_item(self, work_item_id: int) -> Dict[str, Any]:
+        """
+        Async variant of get_work_item.
+
+        The work item and its comments are independent requests, so both are
+        issued concurrently on worker threads instead of one after the other.
+
+        Args:
+            work_item_id: The ID of the work item to retrieve
+
+        Returns:
+            Dictionary containing work item details (see get_work_item)
+        """
+        try:
+            cached, fresh = self._cache.get(work_item_id)
+            if cached is not None and (
+                fresh or await asyncio.to_thread(self._is_unchanged, cached)
+            ):
+                return cached
+
+            (item_id, fields), comments = await asyncio.gather(
+                asyncio.to_thread(self._fetch_work_item_fields, work_item_id),
+                asyncio.to_thread(self.get_work_item_comments, work_item_id),
+            )
 
+            result = _with_comments(_format_work_item(item_id, fields), comments)
+            self._cache.set(work_item_id, result)
             return result
 
         except Exception as e:
             raise Exception(f"Failed to get work item {work_item_id}: {str(e)}")
 
-    def get_work_item_comments(self, work_item_id: int) -> List[Dict[str, Any]]:
+    def _is_unchanged(self, cached: Dict[str, Any]) -> bool:
         """
-        Get all comments for a work item.
+        Revalidate a stale cached work item against the server.
+
+        Only System.ChangedDate is requested; if it still matches, the cached
+        entry's time-to-live is restarted.
+        """
+        _, fields = self._fetch_work_item_fields(cached["id"], fields=["System.ChangedDate"])
+        if fields.get("System.ChangedDate", "") != cached["changed_date"]:
+            return False
+
+        self._cache.set(cached["id"], cached)
+        return True
+
+    def _fetch_work_item_fields(
+        self, work_item_id: int, fields: Optional[List[str]] = None
+    ) -> Tuple[int, Dict[str, Any]]:
+        """
+        Fetch a work item, returning its ID and fields dictionary.
+
+        Only the requested fields are returned, which keeps the payload small
+        compared to expanding all fields, relations and links.
 
         Args:
-            work_item_id: The ID of the work item
+            work_item_id: The ID of the work item to retrieve
+            fields: Field reference names to return (defaults to the fields used in results)
+        """
+        fields = fields or _WORK_ITEM_FIELDS
+
+        if self._use_raw_rest:
+            # Skip the SDK's msrest model deserialization and read the JSON directly
+            response = self._session.get(
+                f"{self._wit_api_url}/workitems/{work_item_id}",
+                params={"fields": ",".join(fields), "api-version": "7.1"},
+                timeout=_REQUEST_TIMEOUT,
+            )
+            response.raise_for_status()
+            data = _json_loads(response.content)
+            return data["id"], data["fields"]
+
+        work_item = self.wit_client.get_work_item(
+            id=work_item_id,
+            project=self.project,
+            fields=fields
+        )
+        return work_item.id, work_item.fields
+
+    def get_work_items_batch(
+        self, ids: List[int], fields: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get several work items in a single request via the workitemsbatch endpoint.
+
+        Comments are not included; use get_work_item for the full details of one item.
+
+        Args:
+            ids: IDs of the work items to retrieve (at most MAX_BATCH_SIZE)
+            fields: Field reference names to return (defaults to the fields used in results)
 
         Returns:
-            List of comment dictionaries with text, author, and date
+            List of work item dictionaries (see get_work_item, without comments).
+            IDs that don't exist or can't be read are left out.
         """
         try:
-            comments_result = self.wit_client.get_comments(
-                project=self.project,
-                work_item_id=work_item_id
+            response = self._session.post(
+                f"{self._wit_api_url}/workitemsbatch",
+                params={"api-version": "7.1"},
+                json=_batch_request_body(ids, fields),
+                timeout=_REQUEST_TIMEOUT,
             )
+            return _work_items_from_batch(response)
 
-            comments = []
-            if comments_result and hasattr(comments_result, 'comments'):
-                for comment in comments_result.comments:
-                    comments.append({
-                        "text": comment.text,
-                        "created_by": comment.created_by.display_name if comment.created_by else "Unknown",
-                        "created_date": str(comment.created_date) if comment.created_date else "",
-                    })
+        except Exception as e:
+            raise Exception(f"Failed to get a batch of {len(ids)} work items: {str(e)}")
 
-            return comments
+    async def _fetch_chunk(
+        self, ids: List[int], fields: Optional[List[str]]
+    ) -> List[Dict[str, Any]]:
+        """Run one workitemsbatch request on a worker thread."""
+        return await asyncio.to_thread(self.get_work_items_batch, ids, fields)
+
+    def get_work_item_comments(self, work_item_id: int) -> List[Comment]:
+        """
+        Get all comments for a work item.
+
+        Args:
+            work_item_id: The ID of the work item
+
+        Returns:
+            List of comments with text, author, and date. Empty if the
+            work item has no comments or comments are not available (404).
+
+        Raises:
+            Exception: On authentication failures, exhausted throttling retries or
+                other request errors, rather than reporting them as "no comments"
+        """
+        try:
+            # Throttling (429) is retried by the session's retry policy
+            response = self._session.get(
+                f"{self._wit_api_url}/workItems/{work_item_id}/comments",
+                params={"api-version": "7.1-preview.4"},
+                timeout=_REQUEST_TIMEOUT,
+            )
+            return _comments_from_response(response)
 
         except Exception as e:
-            # Some work items might not have comments enabled
-            return []
+            raise Exception(f"Failed to get comments for work item {work_item_id}: {str(e)}")
+
+    async def aupdate_work_item_state(
+        self, work_item_id: int, new_state: str, include_comments: bool = False
+    ) -> Dict[str, Any]:
+        """Async variant of update_work_item_state, run on a worker thread."""
+        return await asyncio.to_thread(
+            self.update_work_item_state, work_item_id, new_state, include_comments
+        )
 
-    def update_work_item_state(self, work_item_id: int, new_state: str) -> Dict[str, Any]:
+    def update_work_item_state(
+        self, work_item_id: int, new_state: str, include_comments: bool = False
+    ) -> Dict[str, Any]:
         """
         Update the state/status of a work item.
 
         Args:
             work_item_id: The ID of the work item to update
             new_state: The new state to set (e.g., "Active", "Closed", "Resolved")
+            include_comments: Also fetch the work item's comments
 
         Returns:
             Dictionary containing updated work item details
@@ -152,11 +612,223 @@ class ADOClient:
             updated_work_item = self.wit_client.update_work_item(
                 document=patch_document,
                 id=work_item_id,
-                project=self.project
+                project=self.project,
+                expand="Fields"
             )
 
-            # Return updated work item details
-            return self.get_work_item(work_item_id)
+            # Cached details (and comments) for this item are now out of date
+            self._cache.pop(work_item_id)
+
+            # The update response already carries the updated fields
+            result = _format_work_item(updated_work_item.id, updated_work_item.fields)
+
+            if include_comments:
+                _with_comments(result, self.get_work_item_comments(work_item_id))
+
+            return result
+
+        except Exception as e:
+            raise Exception(f"Failed to update work item {work_item_id} state to '{new_state}': {str(e)}")
+
+
+class ADOAsyncClient(_BatchMixin):
+    """
+    Pure-async client for the Azure DevOps work item REST API built on httpx.
+
+    Requests share one pooled httpx.AsyncClient (multiplexed over HTTP/2 when the
+    h2 package is installed) and are awaited directly on the event loop, so no
+    worker threads are involved. Method names and results match the async
+    methods of ADOClient so the server can use either client.
+    """
+
+    __slots__ = ("organization", "project", "_client", "_cache", "_batch_semaphore")
+
+    def __init__(self, config: Optional[ADOConfig] = None):
+        """
+        Initialize the async ADO client.
+
+        Args:
+            config: Connection settings; defaults to the cached environment config
+        """
+        if config is None:
+            config = get_config()
+
+        self.organization = config.organization
+        self.project = config.project
+
+        self._client = httpx.AsyncClient(
+            base_url=f"https://dev.azure.com/{self.organization}/{quote(self.project)}/_apis/wit/",
+            auth=("", config.pat),
+            params={"api-version": "7.1"},
+            timeout=_REQUEST_TIMEOUT,
+            # The transport retries connection failures; status codes are retried in _request
+            transport=httpx.AsyncHTTPTransport(
+                http2=_HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_keepalive_connections=20),
+                retries=_RETRY_POLICY.total,
+            ),
+        )
+
+        # Recently fetched work items, keyed by ID
+        self._cache = _TTLCache(_CACHE_MAXSIZE, _CACHE_TTL_SECONDS)
+
+        # Caps batch requests in flight across all calls; created on first use
+        self._batch_semaphore: Optional[asyncio.Semaphore] = None
+
+    async def awarm_up(self) -> None:
+        """
+        Open a pooled connection before the first tool call needs it.
+
+        A small work item tracking request pays the TLS handshake up front.
+        Failures are ignored; the real request will report them.
+        """
+        try:
+            await self._client.get("workitemtypecategories")
+        except Exception:
+            pass
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "ADOAsyncClient":
+        return self
+
+    async def __aexit__(self, *exc_details) -> None:
+        await self.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request, retrying throttled and transient server failures like ADOClient."""
+        for attempt in range(_RETRY_POLICY.total + 1):
+            response = await self._client.request(method, url, **kwargs)
+            if (
+                response.status_code not in _RETRY_POLICY.status_forcelist
+                or attempt == _RETRY_POLICY.total
+            ):
+                return response
+            await asyncio.sleep(_retry_delay(response, attempt))
+
+    async def aget_work_item(self, work_item_id: int) -> Dict[str, Any]:
+        """
+        Get detailed information about a work item.
+
+        The work item fields and comments are requested concurrently.
+
+        Args:
+            work_item_id: The ID of the work item to retrieve
+
+        Returns:
+            Dictionary containing work item details (see ADOClient.get_work_item)
+        """
+        try:
+            cached, fresh = self._cache.get(work_item_id)
+            if cached is not None and (fresh or await self._is_unchanged(cached)):
+                return cached
+
+            (item_id, fields), comments = await asyncio.gather(
+                self._fetch_work_item_fields(work_item_id),
+                self.aget_work_item_comments(work_item_id),
+            )
+
+            result = _with_comments(_format_work_item(item_id, fields), comments)
+            self._cache.set(work_item_id, result)
+            return result
+
+        except Exception as e:
+            raise Exception(f"Failed to get work item {work_item_id}: {str(e)}")
+
+    async def _is_unchanged(self, cached: Dict[str, Any]) -> bool:
+        """Revalidate a stale cached work item by its System.ChangedDate."""
+        _, fields = await self._fetch_work_item_fields(
+            cached["id"], fields=["System.ChangedDate"]
+        )
+        if fields.get("System.ChangedDate", "") != cached["changed_date"]:
+            return False
+
+        self._cache.set(cached["id"], cached)
+        return True
+
+    async def _fetch_work_item_fields(
+        self, work_item_id: int, fields: Optional[List[str]] = None
+    ) -> Tuple[int, Dict[str, Any]]:
+        """Fetch a work item's requested fields, returning its ID and fields dictionary."""
+        response = await self._request(
+            "GET",
+            f"workitems/{work_item_id}",
+            params={"fields": ",".join(fields or _WORK_ITEM_FIELDS)},
+        )
+        response.raise_for_status()
+        data = _json_loads(response.content)
+        return data["id"], data["fields"]
+
+    async def _fetch_chunk(
+        self, ids: List[int], fields: Optional[List[str]]
+    ) -> List[Dict[str, Any]]:
+        """Run one workitemsbatch request."""
+        try:
+            response = await self._request(
+                "POST", "workitemsbatch", json=_batch_request_body(ids, fields)
+            )
+            return _work_items_from_batch(response)
+
+        except Exception as e:
+            raise Exception(f"Failed to get a batch of {len(ids)} work items: {str(e)}")
+
+    async def aget_work_item_comments(self, work_item_id: int) -> List[Comment]:
+        """
+        Get all comments for a work item.
+
+        Args:
+            work_item_id: The ID of the work item
+
+        Returns:
+            List of comments; empty if comments are not available (404)
+        """
+        try:
+            response = await self._request(
+                "GET",
+                f"workItems/{work_item_id}/comments",
+                params={"api-version": "7.1-preview.4"},
+            )
+            return _comments_from_response(response)
+
+        except Exception as e:
+            raise Exception(f"Failed to get comments for work item {work_item_id}: {str(e)}")
+
+    async def aupdate_work_item_state(
+        self, work_item_id: int, new_state: str, include_comments: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Update the state/status of a work item.
+
+        Args:
+            work_item_id: The ID of the work item to update
+            new_state: The new state to set (e.g., "Active", "Closed", "Resolved")
+            include_comments: Also fetch the work item's comments
+
+        Returns:
+            Dictionary containing updated work item details
+        """
+        try:
+            response = await self._request(
+                "PATCH",
+                f"workitems/{work_item_id}",
+                params={"$expand": "Fields"},
+                json=[{"op": "add", "path": "/fields/System.State", "value": new_state}],
+                headers={"Content-Type": "application/json-patch+json"},
+            )
+            response.raise_for_status()
+            data = _json_loads(response.content)
+
+            # Cached details (and comments) for this item are now out of date
+            self._cache.pop(work_item_id)
+
+            result = _format_work_item(data["id"], data["fields"])
+
+            if include_comments:
+                _with_comments(result, await self.aget_work_item_comments(work_item_id))
+
+            return result
 
         except Exception as e:
             raise Exception(f"Failed to update work item {work_item_id} state to '{new_state}': {str(e)}")
@@ -1,74 +1,196 @@
 """Azure DevOps MCP Server implementation."""
 
 import asyncio
-import os
-from typing import Any
-from dotenv import load_dotenv
+import functools
+from typing import Any, Optional
 from mcp.server.models import InitializationOptions
 from mcp.server import NotificationOptions, Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from .ado_client import ADOClient
-
-# Load environment variables from .env file
-load_dotenv()
+from .ado_client import SUMMARY_FIELDS, ADOAsyncClient, ADOClient, get_config
 
 # Create MCP server instance
 server = Server("ado-mcp")
 
 # Global ADO client instance
-ado_client: ADOClient = None
+ado_client: ADOClient | ADOAsyncClient = None
 
+# In-flight creation of ado_client, started at startup or by the first tool call
+_ado_client_task: Optional[asyncio.Task] = None
 
-@server.list_tools()
-async def handle_list_tools() -> list[Tool]:
-    """List available tools for Azure DevOps integration."""
-    return [
-        Tool(
-            name="get_work_item",
-            description="Get detailed information about an Azure DevOps work item including description, steps to reproduce, comments, status, and other metadata. Works with all work item types (Bugs, Tasks, User Stories, etc.)",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "work_item_id": {
-                        "type": "integer",
-                        "description": "The ID of the work item to retrieve",
-                    }
-                },
-                "required": ["work_item_id"],
+
+def _create_ado_client() -> ADOClient | ADOAsyncClient:
+    """Create the configured ADO client (the httpx client if USE_ASYNC_CLIENT=1)."""
+    if get_config().use_async_client:
+        return ADOAsyncClient()
+    return ADOClient()
+
+
+async def _init_ado_client() -> None:
+    """Create (and warm up) the ADO client on a worker thread."""
+    global ado_client
+    client = await asyncio.to_thread(_create_ado_client)
+
+    # ADOClient warms up in its constructor; the httpx client has to do it on the loop
+    if isinstance(client, ADOAsyncClient):
+        await client.awarm_up()
+
+    ado_client = client
+
+
+def _start_ado_client() -> asyncio.Task:
+    """Start creating the ADO client in the background."""
+    task = asyncio.create_task(_init_ado_client())
+    # Failures are reported by the tool call that awaits the task, not logged here
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+    return task
+
+
+async def _ensure_ado_client() -> None:
+    """Wait for the ADO client, starting a new attempt if none is in flight."""
+    global _ado_client_task
+
+    if _ado_client_task is None:
+        _ado_client_task = _start_ado_client()
+
+    try:
+        # Shield so a cancelled tool call doesn't abort creation for other callers
+        await asyncio.shield(_ado_client_task)
+    except Exception:
+        # Let the next tool call try again
+        _ado_client_task = None
+        raise
+
+
+class _WorkItemKey:
+    """Wraps a work item dict so lru_cache keys it on (id, changed_date)."""
+
+    __slots__ = ("work_item", "_key")
+
+    def __init__(self, work_item: dict):
+        self.work_item = work_item
+        self._key = (work_item["id"], work_item["changed_date"])
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _WorkItemKey) and self._key == other._key
+
+
+def _format_work_item_text(work_item: dict) -> str:
+    """Format a work item for display, reusing the text for unchanged items."""
+    return _render_work_item_text(_WorkItemKey(work_item))
+
+
+@functools.lru_cache(maxsize=128)
+def _render_work_item_text(key: _WorkItemKey) -> str:
+    work_item = key.work_item
+
+    response_lines = [
+        f"Work Item #{work_item['id']}: {work_item['title']}",
+        f"Type: {work_item['type']}",
+        f"State: {work_item['state']}",
+        f"Assigned To: {work_item['assigned_to']}",
+        f"Created: {work_item['created_date']} by {work_item['created_by']}",
+        f"Last Changed: {work_item['changed_date']}",
+        f"Area Path: {work_item['area_path']}",
+        f"Iteration: {work_item['iteration_path']}",
+    ]
+
+    if work_item.get("tags"):
+        response_lines.append(f"Tags: {work_item['tags']}")
+
+    response_lines.append("\n--- Description ---")
+    response_lines.append(work_item.get("description", "No description"))
+
+    if work_item.get("steps_to_reproduce"):
+        response_lines.append("\n--- Steps to Reproduce ---")
+        response_lines.append(work_item["steps_to_reproduce"])
+
+    # Add comments
+    comment_count = work_item["comment_count"]
+    if comment_count > 0:
+        response_lines.append(f"\n--- Comments ({comment_count}) ---")
+        response_lines.append(
+            "\n".join(
+                f"\nComment {i} by {comment.created_by} on {comment.created_date}:\n{comment.text}"
+                for i, comment in enumerate(work_item["comments"], 1)
+            )
+        )
+    else:
+        response_lines.append("\n--- Comments ---")
+        response_lines.append("No comments")
+
+    return "\n".join(response_lines)
+
+
+# Tool definitions are static, so build (and validate) them once
+_TOOLS = [
+    Tool(
+        name="get_work_item",
+        description="Get detailed information about an Azure DevOps work item including description, steps to reproduce, comments, status, and other metadata. Works with all work item types (Bugs, Tasks, User Stories, etc.)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "work_item_id": {
+                    "type": "integer",
+                    "description": "The ID of the work item to retrieve",
+                }
+            },
+            "required": ["work_item_id"],
+        },
+    ),
+    Tool(
+        name="get_work_items",
+        description="Get summary information (title, type, state, assigned to) for several Azure DevOps work items at once. Use get_work_item for the full details and comments of a single item.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "work_item_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "The IDs of the work items to retrieve",
+                }
             },
-        ),
-        Tool(
-            name="update_work_item_status",
-            description="Update the state/status of an Azure DevOps work item. Common states include: New, Active, Resolved, Closed, Removed. Note: Available states depend on your work item type and process template.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "work_item_id": {
-                        "type": "integer",
-                        "description": "The ID of the work item to update",
-                    },
-                    "new_state": {
-                        "type": "string",
-                        "description": "The new state to set (e.g., 'Active', 'Resolved', 'Closed'). Must be a valid state for the work item type.",
-                    },
+            "required": ["work_item_ids"],
+        },
+    ),
+    Tool(
+        name="update_work_item_status",
+        description="Update the state/status of an Azure DevOps work item. Common states include: New, Active, Resolved, Closed, Removed. Note: Available states depend on your work item type and process template.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "work_item_id": {
+                    "type": "integer",
+                    "description": "The ID of the work item to update",
+                },
+                "new_state": {
+                    "type": "string",
+                    "description": "The new state to set (e.g., 'Active', 'Resolved', 'Closed'). Must be a valid state for the work item type.",
                 },
-                "required": ["work_item_id", "new_state"],
             },
-        ),
-    ]
+            "required": ["work_item_id", "new_state"],
+        },
+    ),
+]
+
+
+@server.list_tools()
+async def handle_list_tools() -> list[Tool]:
+    """List available tools for Azure DevOps integration."""
+    return _TOOLS
 
 
 @server.call_tool()
 async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
     """Handle tool execution requests."""
-    global ado_client
-
-    # Initialize ADO client on first use
+    # Wait for the ADO client if startup creation hasn't finished (or failed)
     if ado_client is None:
         try:
-            ado_client = ADOClient()
+            await _ensure_ado_client()
         except ValueError as e:
             return [
                 TextContent(
@@ -96,41 +218,31 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
                 ]
 
             # Get work item details
-            work_item = ado_client.get_work_item(work_item_id)
-
-            # Format the response
-            response_lines = [
-                f"Work Item #{work_item['id']}: {work_item['title']}",
-                f"Type: {work_item['type']}",
-                f"State: {work_item['state']}",
-                f"Assigned To: {work_item['assigned_to']}",
-                f"Created: {work_item['created_date']} by {work_item['created_by']}",
-                f"Last Changed: {work_item['changed_date']}",
-                f"Area Path: {work_item['area_path']}",
-                f"Iteration: {work_item['iteration_path']}",
-            ]
+            work_item = await ado_client.aget_work_item(work_item_id)
 
-            if work_item.get("tags"):
-                response_lines.append(f"Tags: {work_item['tags']}")
+            return [TextContent(type="text", text=_format_work_item_text(work_item))]
 
-            response_lines.append("\n--- Description ---")
-            response_lines.append(work_item.get("description", "No description"))
+        elif name == "get_work_items":
+            work_item_ids = arguments.get("work_item_ids")
+            if not work_item_ids:
+                return [
+                    TextContent(
+                        type="text",
+                        text="Error: work_item_ids is required",
+                    )
+                ]
 
-            if work_item.get("steps_to_reproduce"):
-                response_lines.append("\n--- Steps to Reproduce ---")
-                response_lines.append(work_item["steps_to_reproduce"])
+            work_items = await ado_client.aget_work_items_batch(
+                work_item_ids, fields=SUMMARY_FIELDS
+            )
 
-            # Add comments
-            if work_item["comment_count"] > 0:
-                response_lines.append(f"\n--- Comments ({work_item['comment_count']}) ---")
-                for i, comment in enumerate(work_item["comments"], 1):
-                    response_lines.append(
-                        f"\nComment {i} by {comment['created_by']} on {comment['created_date']}:"
-                    )
-                    response_lines.append(comment["text"])
-            else:
-                response_lines.append("\n--- Comments ---")
-                response_lines.append("No comments")
+            response_lines = [f"Retrieved {len(work_items)} work item(s)"]
+            for work_item in work_items:
+                response_lines.append(
+                    f"\n#{work_item['id']}: {work_item['title']}\n"
+                    f"Type: {work_item['type']} | State: {work_item['state']} | "
+                    f"Assigned To: {work_item['assigned_to']}"
+                )
 
             return [TextContent(type="text", text="\n".join(response_lines))]
 
@@ -147,7 +259,7 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
                 ]
 
             # Update the work item state
-            updated_work_item = ado_client.update_work_item_state(work_item_id, new_state)
+            updated_work_item = await ado_client.aupdate_work_item_state(work_item_id, new_state)
 
             response = f"Successfully updated work item #{work_item_id}\n"
             response += f"Title: {updated_work_item['title']}\n"
@@ -176,19 +288,32 @@ async def handle_call_tool(name: str, arguments: dict) -> list[TextContent]:
 
 async def main():
     """Run the MCP server."""
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(
-            read_stream,
-            write_stream,
-            InitializationOptions(
-                server_name="ado-mcp",
-                server_version="0.1.0",
-                capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(),
-                    experimental_capabilities={},
+    global _ado_client_task
+
+    # Create the ADO client in the background so the first tool call doesn't pay
+    # setup cost, without delaying the MCP handshake if Azure DevOps is slow or
+    # unreachable. Failures are reported (and retried) by handle_call_tool.
+    _ado_client_task = _start_ado_client()
+
+    try:
+        async with stdio_server() as (read_stream, write_stream):
+            await server.run(
+                read_stream,
+                write_stream,
+                InitializationOptions(
+                    server_name="ado-mcp",
+                    server_version="0.1.0",
+                    capabilities=server.get_capabilities(
+                        notification_options=NotificationOptions(),
+                        experimental_capabilities={},
+                    ),
                 ),
-            ),
-        )
+            )
+    finally:
+        if isinstance(ado_client, ADOAsyncClient):
+            await ado_client.aclose()
+        elif ado_client is not None:
+            ado_client.close()
 
 
 def run():